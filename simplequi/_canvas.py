@@ -23,23 +23,28 @@ from collections import namedtuple
 from enum import Enum
 from functools import wraps
 from math import pi
-from typing import Callable, Iterable, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple
 from typing import SupportsInt
 from typing import Union
 
 from PySide2.QtCore import QTimerEvent
 from PySide2.QtCore import Qt, QPoint, Signal
-from PySide2.QtGui import (QBrush, QColor, QKeyEvent, QMouseEvent, QPainter, QPaintEvent,
-                           QPalette, QPen, QPixmap, QPolygon, QTransform)
+from PySide2.QtGui import (QBrush, QColor, QImage, QKeyEvent, QMouseEvent, QPainter, QPaintEvent,
+                           QPalette, QPen, QPolygon, QTransform)
 from PySide2.QtWidgets import QHBoxLayout, QWidget
 
-from ._colours import get_colour
+from ._colours import check_colour_type, get_colour
 from ._constants import NO_MARGINS, Point, Size
 from ._fonts import get_font, FontSpec
 from ._image import Image, get_pixmap
 
 ObjectHolder = namedtuple('ObjectHolder', ['obj_type', 'args'])
 
+_BRUSH_CACHE = {}  #: Stores brushes for each lower-case colour string so they aren't recreated on every render
+_PEN_CACHE = {}  #: Stores pens for each lower-case colour string and line width so they aren't recreated every render
+_STYLE_CACHE_SIZE = 256  #: Pen and brush caches are cleared at this size, in case colours are generated on the fly
+_RADIANS_TO_QPAINTER = 16 * 180 / pi  #: Converts radians to 1/16ths of a degree with a single multiplication
+
 
 def radians_to_qpainter_angle(rads):
     # type: (float) -> int
@@ -48,7 +53,7 @@ def radians_to_qpainter_angle(rads):
     :param rads: angle to covert in radians
     :return: an angle in 1/16:sup:`ths` of a degree
     """
-    return int(360 * 16 * rads / (2 * pi))
+    return int(round(rads * _RADIANS_TO_QPAINTER))  # Rounded, as truncation is off by one for angles like 249 degrees
 
 
 def point_list_to_polygon(point_list):
@@ -58,10 +63,78 @@ def point_list_to_polygon(point_list):
     :param point_list: ordered iterable of points that make up the polygon
     :return: a polygon with the given points
     """
-    polygon = QPolygon()
-    for point in point_list:
-        polygon.push_back(QPoint(*point))
-    return polygon
+    return QPolygon([QPoint(*point) for point in point_list])
+
+
+def is_axis_aligned(point_list):
+    # type: (List[Point]) -> bool
+    """Checks whether all edges of a closed shape are horizontal or vertical.
+
+    :param point_list: ordered list of points that make up the shape (the final point is joined to the first point)
+    :return: whether every edge is parallel to one of the axes
+    """
+    edges = zip(point_list, point_list[1:] + point_list[:1])
+    return all(start[0] == end[0] or start[1] == end[1] for start, end in edges)
+
+
+def disable_antialiasing(painter):
+    # type: (QPainter) -> None
+    """Turns off antialiasing, which roughly doubles the cost of drawing.
+
+    This only leaves the output unchanged for axis-aligned shapes drawn with an even, non-zero line width. The edges of
+    those lie on pixel boundaries, whereas odd-width lines at integer coordinates straddle half pixels and are visibly
+    sharper without antialiasing. Zero-width lines are drawn by Qt with a 1px cosmetic pen, so count as odd.
+
+    The render hint is restored along with the rest of the painter state when ``painter.restore()`` is called.
+
+    :param painter: the painter to be modified
+    """
+    painter.setRenderHint(QPainter.Antialiasing, False)
+
+
+def get_colour_key(colour):
+    # type: (str) -> str
+    """Gets the key to cache styles of the given colour under, as colour strings are case-insensitive.
+
+    :param colour: the colour to get the key for
+    :return: the lower-case colour string
+    :raises TypeError: if the colour is not a string, exactly as :func:`get_colour` would
+    """
+    check_colour_type(colour)
+    return colour.lower()
+
+
+def get_brush(colour):
+    # type: (str) -> QBrush
+    """Gets and if necessary caches a solid brush of the given colour.
+
+    :param colour: the colour of the brush
+    :return: a :class:`QBrush` that can be used for filling or to create a :class:`QPen`
+    """
+    key = get_colour_key(colour)
+    brush = _BRUSH_CACHE.get(key)
+    if brush is None:
+        if len(_BRUSH_CACHE) >= _STYLE_CACHE_SIZE:
+            _BRUSH_CACHE.clear()
+        brush = _BRUSH_CACHE[key] = QBrush(get_colour(key))
+    return brush
+
+
+def get_pen(line_width, line_colour):
+    # type: (int, str) -> QPen
+    """Gets and if necessary caches a pen with the given line width and colour.
+
+    :param line_width: the line width of the pen
+    :param line_colour: the line colour of the pen
+    :return: a :class:`QPen` that can be used for drawing lines
+    """
+    key = (line_width, get_colour_key(line_colour))
+    pen = _PEN_CACHE.get(key)
+    if pen is None:
+        if len(_PEN_CACHE) >= _STYLE_CACHE_SIZE:
+            _PEN_CACHE.clear()
+        pen = _PEN_CACHE[key] = QPen(get_brush(line_colour), line_width)
+    return pen
 
 
 def set_painter_line_width_and_colour(painter, line_width, line_colour):
@@ -72,8 +145,7 @@ def set_painter_line_width_and_colour(painter, line_width, line_colour):
     :param line_width: the new line width to set
     :param line_colour: the new line colour to set
     """
-    pen = QPen(QBrush(get_colour(line_colour)), line_width)
-    painter.setPen(pen)
+    painter.setPen(get_pen(line_width, line_colour))
 
 
 def set_painter_fill_colour(painter, fill_colour):
@@ -83,7 +155,7 @@ def set_painter_fill_colour(painter, fill_colour):
     :param painter: the painter to be modified
     :param fill_colour: the new fill colour to set
     """
-    painter.setBrush(QBrush(get_colour(fill_colour)))
+    painter.setBrush(get_brush(fill_colour))
 
 
 def set_painter_lines_and_fill(painter, line_width, line_colour, fill_colour=None):
@@ -95,9 +167,10 @@ def set_painter_lines_and_fill(painter, line_width, line_colour, fill_colour=Non
     :param line_colour: the new line colour to set
     :param fill_colour: the new fill colour to set
     """
-    set_painter_line_width_and_colour(painter, line_width, line_colour)
+    # Pen and brush are set here directly rather than through the single-purpose helpers, to save two extra calls
+    painter.setPen(get_pen(line_width, line_colour))
     if fill_colour is not None:
-        set_painter_fill_colour(painter, fill_colour)
+        painter.setBrush(get_brush(fill_colour))
 
 
 def render_line(painter, start, end, line_width, line_colour):
@@ -111,6 +184,8 @@ def render_line(painter, start, end, line_width, line_colour):
     :param line_colour: the colour of the line to draw
     """
     set_painter_line_width_and_colour(painter, line_width, line_colour)
+    if line_width > 0 and line_width % 2 == 0 and (start[0] == end[0] or start[1] == end[1]):
+        disable_antialiasing(painter)
     painter.drawLine(*start, *end)
 
 
@@ -206,6 +281,8 @@ def render_polygon(painter, point_list, line_width, line_colour, fill_colour=Non
     :param fill_colour: the colour to fill the polygon with, optional, defaults to transparent
     """
     set_painter_lines_and_fill(painter, line_width, line_colour, fill_colour)
+    if line_width > 0 and line_width % 2 == 0 and is_axis_aligned(point_list):
+        disable_antialiasing(painter)
     polygon = point_list_to_polygon(point_list)
     painter.drawPolygon(polygon)
 
@@ -335,7 +412,8 @@ class DrawingArea(QWidget):
         self.setBackgroundRole(QPalette.Base)
         self.setPalette(self.__palette)
         self.__background_colour = get_colour('black')
-        self.__reset_pixmap()
+        self.__create_image()
+        self.__update_opaque_painting()
 
         # Drawing stuff
         self.__canvas = Canvas(self)
@@ -343,6 +421,7 @@ class DrawingArea(QWidget):
         self.__new_objects = []
         self.__draw_handler = None
         self.__draw_timer_id = None
+        self.__drawing = False  # Guards against re-entrant draws if the handler processes events itself
 
         # Event stuff
         self.__started = False
@@ -367,7 +446,8 @@ class DrawingArea(QWidget):
 
         self.__draw_handler = draw_handler
         if self.__started:
-            self.__draw_timer_id = self.startTimer(17)  # Roughly 60FPS
+            # Roughly 60FPS - a precise timer keeps to this, where the default coarse timer may drift by up to 5%
+            self.__draw_timer_id = self.startTimer(17, Qt.PreciseTimer)
 
     def timerEvent(self, event):
         # type: (QTimerEvent) -> None
@@ -379,19 +459,36 @@ class DrawingArea(QWidget):
             return super().timerEvent(event)
         self.__draw()
 
-    def __reset_pixmap(self):
-        """Sets new pixmap filled with the current background colour."""
-        self.__pixmap = QPixmap(self.__canvas_width, self.__canvas_height)
-        self.__pixmap.fill(self.__background_colour)
+    def __create_image(self):
+        """Sets new image filled with the current background colour.
+
+        Rendering is done on a :class:`QImage` rather than directly on a :class:`QPixmap`, since ``QImage`` is always
+        drawn on by Qt's CPU raster engine, without any round-trip to the platform's native pixmap. The format is
+        chosen to be the fastest one for the raster engine that can still represent the background colour, so the image
+        only needs replacing when the background colour changes - otherwise :meth:`__render` just refills it.
+        """
+        opaque = self.__background_colour.alpha() == 255
+        image_format = QImage.Format_RGB32 if opaque else QImage.Format_ARGB32_Premultiplied
+        self.__image = QImage(self.__canvas_width, self.__canvas_height, image_format)
+        self.__image.fill(self.__background_colour)
 
     @check_started
     def __draw(self):
-        """Calls the draw handler and re-renders the canvas if necessary"""
-        if self.__draw_handler is None:
+        """Calls the draw handler and re-renders the canvas if necessary
+
+        The primitives queued by the handler are compared with those from the previous frame, and the canvas is only
+        re-rendered if they differ - otherwise the cached image is simply redrawn by :meth:`paintEvent`. The handler
+        itself is always called, since its output can depend on state that changes between frames.
+        """
+        if self.__draw_handler is None or self.__drawing:
             return
 
-        self.__new_objects = []
-        self.__draw_handler(self.__canvas)
+        self.__drawing = True
+        try:
+            self.__new_objects = []
+            self.__draw_handler(self.__canvas)
+        finally:
+            self.__drawing = False
 
         if self.__new_objects != self.__objects:
             self.__objects = self.__new_objects
@@ -399,14 +496,15 @@ class DrawingArea(QWidget):
 
     def __render(self):
         """Actually renders the canvas"""
-        self.__reset_pixmap()
-        painter = QPainter(self.__pixmap)
+        self.__image.fill(self.__background_colour)  # Clear the previous frame in one pass, reusing the image
+        painter = QPainter(self.__image)
         painter.setRenderHint(
             QPainter.RenderHint(QPainter.Antialiasing | QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform))
         for obj in self.__objects:
             painter.save()
             OBJECT_RENDERERS[obj.obj_type](painter, *obj.args)
             painter.restore()
+        painter.end()
         self.update()
 
     def add_object(self, primitive):
@@ -426,17 +524,31 @@ class DrawingArea(QWidget):
         self.__palette.setColor(QPalette.Base, colour)
         self.setPalette(self.__palette)
         self.__background_colour = colour
+        self.__update_opaque_painting()
+        self.__create_image()
         self.__render()
 
-    @check_started
+    def __update_opaque_painting(self):
+        """Tells Qt whether the cached image covers the whole widget, depending on the background colour.
+
+        With an opaque background, every pixel is drawn by :meth:`paintEvent`, so Qt can skip filling in the background
+        and repainting the parent beneath the canvas before each blit. With a translucent background, it cannot.
+        """
+        self.setAttribute(Qt.WA_OpaquePaintEvent, self.__background_colour.alpha() == 255)
+
     def paintEvent(self, _event):
         # type: (QPaintEvent) -> None
-        """Draws cached pixmap on the canvas - :meth:`__render` takes care of creating it in the first place
+        """Draws the cached image on the canvas - :meth:`__render` takes care of creating it in the first place
+
+        The image is drawn directly rather than converted to a :class:`QPixmap` after each render, since on the raster
+        engine such a pixmap shares the image's pixel buffer, and the next render would then have to copy the whole
+        buffer before it could draw on it again. This is done even before the frame is started, as the image is always
+        valid and filled with the background.
 
         :param _event: the paint event passed in by Qt, not actually used
         """
         painter = QPainter(self)
-        painter.drawPixmap(self.rect(), self.__pixmap)
+        painter.drawImage(self.rect(), self.__image)
 
     # Events
     def start(self):
@@ -607,6 +719,10 @@ class Canvas:
         """Initialises the wrapper"""
         self.__drawing_area = drawing_area
 
+        # The drawing area has a fixed size, so its bounds can be stored here to cull primitives that can't be seen
+        self.__width = drawing_area.width()
+        self.__height = drawing_area.height()
+
     @staticmethod
     def __ensure_int_coordinates(*coordinates):
         # type: (Union[Iterable[Point], Point]) -> Union[Iterable[Point], Point]
@@ -618,12 +734,21 @@ class Canvas:
         :param coordinates: arbitrary number of coordinate pairs (x, y)
         :return: single point or list of points, depending on number of ``coordinates`` passed
         """
-        res = []
-        for coord in coordinates:
-            new_coord = (int(coord[0]), int(coord[1]))
-            res.append(new_coord)
+        res = [(int(coord[0]), int(coord[1])) for coord in coordinates]
         return res[0] if len(res) == 1 else res
 
+    @staticmethod
+    def __ensure_int_point_list(point_list):
+        # type: (Iterable[Point]) -> List[Point]
+        """Casts a list of point coordinates to int.
+
+        Unlike :meth:`__ensure_int_coordinates`, this always returns a list, even if it only contains one point.
+
+        :param point_list: the points to cast
+        :return: list of points with int coordinates
+        """
+        return [(int(point[0]), int(point[1])) for point in point_list]
+
     @staticmethod
     def __ensure_int_values(*values):
         # type: (Union[Iterable[SupportsInt], SupportsInt]) -> (Union[Iterable[SupportsInt], SupportsInt])
@@ -635,11 +760,49 @@ class Canvas:
         :param values: arbitrary number of values that can be cast to int
         :return: single value or list of values, depending on number of ``values`` passed
         """
-        res = []
-        for val in values:
-            res.append(int(val))
+        res = [int(val) for val in values]
         return res[0] if len(res) == 1 else res
 
+    def __is_off_canvas(self, left, top, right, bottom):
+        # type: (int, int, int, int) -> bool
+        """Checks whether a bounding box lies entirely outside the canvas, in which case there is no point drawing it.
+
+        :param left: the left edge of the bounding box
+        :param top: the top edge of the bounding box
+        :param right: the right edge of the bounding box
+        :param bottom: the bottom edge of the bounding box
+        :return: whether none of the bounding box is on the canvas
+        """
+        return right < 0 or bottom < 0 or left > self.__width or top > self.__height
+
+    def __are_points_off_canvas(self, point_list, margin):
+        # type: (List[Point], int) -> bool
+        """Checks whether the bounding box of some points, expanded by a margin, lies entirely outside the canvas.
+
+        :param point_list: the points to check
+        :param margin: how far outside the points anything could be drawn, e.g. due to the line width
+        :return: whether nothing drawn around the points would be on the canvas
+        """
+        if not point_list:
+            return False
+
+        xs = [point[0] for point in point_list]
+        ys = [point[1] for point in point_list]
+        return self.__is_off_canvas(min(xs) - margin, min(ys) - margin, max(xs) + margin, max(ys) + margin)
+
+    def __is_circle_off_canvas(self, center_point, radius, line_width):
+        # type: (Point, int, int) -> bool
+        """Checks whether a circle (or arc of it) lies entirely outside the canvas.
+
+        :param center_point: the center of the circle
+        :param radius: the radius of the circle
+        :param line_width: the line width the circle is drawn with
+        :return: whether none of the circle would be on the canvas
+        """
+        center_x, center_y = center_point
+        extent = radius + line_width
+        return self.__is_off_canvas(center_x - extent, center_y - extent, center_x + extent, center_y + extent)
+
     def draw_text(self, text, point, font_size, font_color, font_face='serif'):
         # type: (str, Point, int, str, str) -> None
         """Writes the given text string in the given font size, color, and font face.
@@ -669,6 +832,8 @@ class Canvas:
         """
         point1, point2 = self.__ensure_int_coordinates(point1, point2)
         line_width = self.__ensure_int_values(line_width)
+        if self.__are_points_off_canvas([point1, point2], line_width):
+            return
         self.__drawing_area.add_object(ObjectHolder(ObjectTypes.Line, (point1, point2, line_width, line_color)))
 
     def draw_polyline(self, point_list, line_width, line_color):
@@ -682,8 +847,10 @@ class Canvas:
         :param line_width: the line width to draw with
         :param line_color: the line colour to draw with
         """
-        point_list = self.__ensure_int_coordinates(*point_list)
+        point_list = self.__ensure_int_point_list(point_list)
         line_width = self.__ensure_int_values(line_width)
+        if self.__are_points_off_canvas(point_list, line_width):
+            return
         self.__drawing_area.add_object(ObjectHolder(ObjectTypes.Polyline, (point_list, line_width, line_color)))
 
     def draw_polygon(self, point_list, line_width, line_color, fill_color=None):
@@ -700,8 +867,10 @@ class Canvas:
         :param line_color: the line colour to draw with
         :param fill_color: the colour to fill the polygon with, optional, defaults to transparent
         """
-        point_list = self.__ensure_int_coordinates(*point_list)
+        point_list = self.__ensure_int_point_list(point_list)
         line_width = self.__ensure_int_values(line_width)
+        if self.__are_points_off_canvas(point_list, line_width):
+            return
         self.__drawing_area.add_object(ObjectHolder(ObjectTypes.Polygon,
                                                     (point_list, line_width, line_color, fill_color)))
 
@@ -721,6 +890,8 @@ class Canvas:
         """
         center_point = self.__ensure_int_coordinates(center_point)
         radius, line_width = self.__ensure_int_values(radius, line_width)
+        if self.__is_circle_off_canvas(center_point, radius, line_width):
+            return
         self.__drawing_area.add_object(ObjectHolder(ObjectTypes.Circle,
                                                     (center_point, radius, line_width, line_color, fill_color)))
 
@@ -743,6 +914,8 @@ class Canvas:
         """
         center_point = self.__ensure_int_coordinates(center_point)
         radius, line_width = self.__ensure_int_values(radius, line_width)
+        if self.__is_circle_off_canvas(center_point, radius, line_width):
+            return
         self.__drawing_area.add_object(ObjectHolder(ObjectTypes.Arc,
                                                     (center_point, radius, start_angle, end_angle,
                                                      line_width, line_color, fill_color)))
@@ -756,6 +929,8 @@ class Canvas:
         :param color: the colour to draw the point
         """
         point = self.__ensure_int_coordinates(point)
+        if self.__are_points_off_canvas([point], 1):
+            return
         self.__drawing_area.add_object(ObjectHolder(ObjectTypes.Point, (point, color)))
 
     def draw_image(self, image, center_source, width_height_source, center_dest, width_height_dest, rotation=0.0):
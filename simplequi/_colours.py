@@ -25,7 +25,9 @@ Externally, these are most easily accessed using their colour names e.g. 'Blue'.
 Codeskulptor documentation: "More generally, you may use any HTML color name. Furthermore, custom colors and
 transparencies can be specified in a any CSS color format, including hexadecimal, RGB, RGBA, HSL, and HSLA."
 
-Function 'get_colour' converts a colour string to a QColor and also stores it in the module dict for later use.
+Function 'get_colour' converts a colour string to a QColor and also stores it in the module dict for later use. CSS
+colour strings are case-insensitive, so the dict is keyed on lower-case strings, meaning e.g. 'Yellow' and 'YELLOW'
+share a single cached QColor.
 
 Note: this module is entirely generic and not specific to simplequi - it could be used anywhere to convert any valid CSS
 string colour representation to a QColor.
@@ -33,14 +35,12 @@ string colour representation to a QColor.
 
 from enum import Enum
 import re
+from typing import Any, Optional
 
 from PySide2.QtGui import QColor
 
-from ._mapping import MappingWithInitCheck
-
-# Regexp used for parsing colour strings
-NUM_RE = r'(\d+\.?\d*)'
-NUM_RE = re.compile(NUM_RE)
+# Regexp used for parsing colour strings, compiled once here rather than on each parse
+NUM_RE = re.compile(r'(\d+\.?\d*)')
 
 DEFAULT_COLOURS = ['Aqua',
                    'Black',
@@ -69,12 +69,16 @@ class ColourTypes(Enum):
     HSL = ([360, 100, 100, 1], QColor.fromHslF)  # Hue in range 0-360, S,L in percent, 0 <= alpha <= 1
 
 
-class _ColourMap(MappingWithInitCheck):
-    def _init_map(self):
-        """Initialise the global colour map with the simplegui list of named default colours"""
+class _ColourMap(dict):
+    def __init__(self):
+        """Initialise the global colour map with the simplegui list of named default colours.
+
+        This is done up front rather than on first lookup, so that each lookup is just a plain dict access.
+        """
+        super().__init__()
         for colour_name in DEFAULT_COLOURS:
             if QColor.isValidColor(colour_name):
-                self[colour_name] = QColor(colour_name)
+                self[colour_name.lower()] = QColor(colour_name)
             else:
                 raise ValueError('invalid colour name \'{colour}\''.format(colour=colour_name))
 
@@ -83,21 +87,62 @@ class _ColourMap(MappingWithInitCheck):
         """
         Attempts to translate a colour name in any valid CSS format to a QColor
 
-        :param name: name of the colour, or a specification in RGB(A) (with 0-255 or % values) or HSL(A) format
+        :param name: lower-case colour name, or a specification in RGB(A) (with 0-255 or % values) or HSL(A) format
         :raises KeyError: if the name cannot be parsed into a QColor
         :return: ``QColor`` instance to use elsewhere in the app
         """
-        if QColor.isValidColor(name):
-            self[name] = QColor(name)
-        elif name.lower().startswith('rgb'):
+        colour_format = name[:3]  # Key has already been lower-cased by __getitem__
+        if colour_format == 'rgb':
             colour_type = ColourTypes.RGB_PCT if '%' in name else ColourTypes.RGB
-            self[name] = self.__convert_colour_string(name, colour_type)
-        elif name.lower().startswith('hsl'):
-            self[name] = self.__convert_colour_string(name, ColourTypes.HSL)
+            colour = self.__convert_colour_string(name, colour_type)
+        elif colour_format == 'hsl':
+            colour = self.__convert_colour_string(name, ColourTypes.HSL)
+        elif QColor.isValidColor(name):
+            colour = QColor(name)
         else:
             raise KeyError('unknown colour string: ' + name)
 
-        return self[name]
+        self[name] = colour
+        return colour
+
+    @staticmethod
+    def __normalise(name):
+        # type: (Any) -> Any
+        """Lower-cases colour strings, as CSS colour strings are case-insensitive, leaving any other keys unchanged
+
+        :param name: name or specification of a colour
+        :return: the key the colour is cached under
+        """
+        return name.lower() if isinstance(name, str) else name
+
+    def __getitem__(self, name):
+        # type: (str) -> QColor
+        """Gets a colour, parsing and caching it first if necessary, ignoring case
+
+        :param name: name or specification of the colour
+        :raises KeyError: if the name cannot be parsed into a QColor
+        :return: ``QColor`` instance to use elsewhere in the app
+        """
+        return super().__getitem__(self.__normalise(name))
+
+    def get(self, name, default=None):
+        # type: (str, Optional[QColor]) -> Optional[QColor]
+        """Gets an already cached colour, ignoring case
+
+        :param name: name or specification of the colour
+        :param default: returned if the colour is not cached
+        :return: the cached ``QColor``, or ``default``
+        """
+        return super().get(self.__normalise(name), default)
+
+    def __contains__(self, name):
+        # type: (str) -> bool
+        """Checks whether a colour is already cached, ignoring case
+
+        :param name: name or specification of the colour
+        :return: whether the colour has been cached
+        """
+        return super().__contains__(self.__normalise(name))
 
     def __convert_colour_string(self, text, colour_type):
         # type: (str, ColourTypes) -> QColor
@@ -128,7 +173,7 @@ class _ColourMap(MappingWithInitCheck):
         if len(numbers) < 3:
             raise ValueError('not enough values in colour string: ' + text)
 
-        if not all([0.0 <= x <= 1.0 for x in numbers]):
+        if not all(0.0 <= x <= 1.0 for x in numbers):
             raise ValueError('invalid values in colour string: ' + text)
 
         return numbers
@@ -137,6 +182,17 @@ class _ColourMap(MappingWithInitCheck):
 COLOUR_MAP = _ColourMap()  #: Colour cache used to get QColors to use elsewhere in the application
 
 
+def check_colour_type(name):
+    # type: (Any) -> None
+    """Checks a colour specifier is a string, as required by every colour lookup
+
+    :param name: the colour specifier to check
+    :raises TypeError: if the colour specifier is not a string
+    """
+    if type(name) != str:
+        raise TypeError('invalid colour specifier, should be a string. Got type: {}'.format(type(name)))
+
+
 def get_colour(name):
     # type: (str) -> QColor
     """Translates a colour name in any valid CSS format to a QColor
@@ -144,7 +200,5 @@ def get_colour(name):
     :param name: name of the colour, or a specification in RGB(A) (with 0-255 or % values) or HSL(A) format
     :return: ``QColor`` instance to use elsewhere in the app
     """
-    if type(name) != str:
-        raise TypeError('invalid colour specifier, should be a string. Got type: {}'.format(type(name)))
-
+    check_colour_type(name)
     return COLOUR_MAP[name]
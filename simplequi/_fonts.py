@@ -107,8 +107,9 @@ def get_font(font_spec):
     :param font_spec: defines a font in terms of face/family and size
     :return: a :class:`QFont` that can be used for example by a :class:`QPainter`
     """
-    if font_spec in FontManager.FONT_CACHE:
-        return FontManager.FONT_CACHE[font_spec]
+    font = FontManager.FONT_CACHE.get(font_spec)
+    if font is not None:
+        return font
 
     _check_is_valid_font(font_spec)
     font = QFont()
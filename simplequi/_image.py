@@ -20,7 +20,7 @@
 # -----------------------------------------------------------------------------
 """Utilities for loading images from remote locations and managing caching for rendering."""
 
-from typing import Union
+from typing import Tuple, Union
 
 from PySide2.QtCore import QByteArray
 from PySide2.QtGui import QImage, QPixmap
@@ -85,15 +85,15 @@ class Image:
 
 
 def _get_pixmap_key(image_coords, image_rect, target_rect):
-    # type: (Point, Size, Size) -> str
-    """Convert params to hashable string.
+    # type: (Point, Size, Size) -> Tuple[float, ...]
+    """Convert params to hashable tuple, which is much cheaper to build and hash than a formatted string.
 
     :param image_coords: the coordinates of the image center
     :param image_rect: the size of the portion of image to take
     :param target_rect: the size to scale the portion to
-    :return: all the parameters combined in one string
+    :return: all the parameters combined in one tuple
     """
-    return '{},{},{},{},{},{}'.format(*image_coords, *image_rect, *target_rect)
+    return (*image_coords, *image_rect, *target_rect)
 
 
 def get_pixmap(image, image_coords, image_rect, target_rect):
@@ -23,9 +23,12 @@
 
 import os
 import pkg_resources
+from functools import lru_cache
 
-from PySide2.QtCore import QByteArray, QBuffer, QIODevice
-from PySide2.QtGui import QPixmap
+from PySide2.QtCore import QCoreApplication, QElapsedTimer, QEventLoop, QTimer
+from PySide2.QtGui import QImage, QImageReader, QPixmap
+from PySide2.QtMultimedia import QAudio, QAudioDeviceInfo
+from PySide2.QtNetwork import QNetworkAccessManager
 
 from simplequi._image import _IMAGE_CACHE
 
@@ -35,9 +38,20 @@ def get_example_resource_path(filename):
     return pkg_resources.resource_filename('simplequi.examples', 'resources/' + filename)
 
 
+@lru_cache(maxsize=None)
 def sound_unavailable():
-    """Whether the system supports audio outputs"""
-    return bool(os.getenv('NO_AUDIO', False))
+    """Whether the system lacks audio outputs, or audio has been disabled with the NO_AUDIO environment variable"""
+    if os.getenv('NO_AUDIO', False):
+        return True
+
+    return not QAudioDeviceInfo.availableDevices(QAudio.AudioOutput)
+
+
+@lru_cache(maxsize=None)
+def image_loading_unavailable():
+    """Whether local PNG images can't be loaded, as on some stripped down Qt installations"""
+    formats = [bytes(image_format.data()) for image_format in QImageReader.supportedImageFormats()]
+    return 'file' not in QNetworkAccessManager().supportedSchemes() or b'png' not in formats
 
 
 def disable_call_counts():
@@ -46,18 +60,36 @@ def disable_call_counts():
     return bool(var) and var.lower() != 'false'
 
 
-def pixmap_to_bytes(pixmap):
-    """Converts a pixmap to a byte array for easy comparisons"""
-    array = QByteArray()
-    buffer = QBuffer(array)
-    buffer.open(QIODevice.WriteOnly)
-    pixmap.save(buffer, "PNG")
-    return array
+def pump_events(ms, until=None):
+    """Processes events for up to a given time, or until a condition is met, without starting the whole app
+
+    :param ms: the maximum time to process events for, in milliseconds
+    :param until: an optional function, returning whether to stop processing events early
+    :return: whether ``until`` was met, always ``False`` if it was not given
+    """
+    elapsed = QElapsedTimer()
+    elapsed.start()
+    wake = QTimer()  # Makes sure waiting for the next event never overruns the time limit by much
+    wake.start(10)
+    try:
+        while not elapsed.hasExpired(ms):
+            if until is not None and until():
+                return True
+            QCoreApplication.processEvents(QEventLoop.WaitForMoreEvents)
+    finally:
+        wake.stop()
+    return until is not None and bool(until())
+
+
+def pixmap_pixels(pixmap):
+    """Converts a pixmap to its size and raw pixel bytes for easy comparisons, without the cost of encoding it first"""
+    image = pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
+    return image.size().toTuple(), bytes(image.constBits())
 
 
 def pixmap_data(img, x, y, dx, dy, size=None):
-    """Gets a byte array for a pixmap from the given image with the given top left corner, original and target sizes"""
+    """Gets comparison data for a pixmap from the given image with the given top left corner, original and new sizes"""
     pixmap = QPixmap.fromImage(_IMAGE_CACHE[img].copy(x, y, dx, dy))
     if size:
         pixmap = pixmap.scaled(*size)
-    return pixmap_to_bytes(pixmap)
+    return pixmap_pixels(pixmap)
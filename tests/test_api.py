@@ -22,11 +22,10 @@
 import unittest
 
 from PySide2.QtCore import Qt
-from PySide2.QtWidgets import QApplication
 
 import simplequi
 from simplequi._keys import REVERSE_KEY_MAP
-from tests.helpers import get_example_resource_path, sound_unavailable
+from tests.helpers import get_example_resource_path, pump_events, sound_unavailable
 
 
 class TestAPI(unittest.TestCase):
@@ -42,21 +41,21 @@ class TestAPI(unittest.TestCase):
         frame._Frame__main_widget.close()
 
     def test_create_timer(self):
-        """Test a timer running 10 callback at 10ms intervals"""
-        self.calls = 0
+        """Test a timer running 3 callbacks at 1ms intervals"""
+        calls = 0
 
         def callback():
-            self.calls += 1
-            if self.calls == 10:
-                self.timer.stop()
-
-        self.timer = simplequi.create_timer(10, callback)
-        self.timer.start()
-        self.assertTrue(self.timer.is_running())
-        # Enter the event loop to wait for the timer to finish
-        QApplication.instance().exec_()
-        self.assertFalse(self.timer.is_running())
-        self.assertEqual(self.calls, 10)
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                timer.stop()
+
+        timer = simplequi.create_timer(1, callback)
+        timer.start()
+        self.assertTrue(timer.is_running())
+        # Process events until the timer has stopped itself
+        self.assertTrue(pump_events(200, until=lambda: not timer.is_running()))
+        self.assertEqual(calls, 3)
 
     def test_key_map(self):
         """Test all keys in map and reverse mapped to same value"""
@@ -86,8 +85,7 @@ class TestAPI(unittest.TestCase):
     def test_load_image(self):
         """Test image is loaded"""
         image = simplequi.load_image(get_example_resource_path('sample_image.png'))
-        simplequi.create_timer(100, QApplication.instance().exit).start()
-        QApplication.instance().exec_()
+        pump_events(100, until=lambda: image.get_width())
         self.assertEqual(image.get_width(), 1000)
         self.assertEqual(image.get_height(), 1200)
 
@@ -96,8 +94,7 @@ class TestAPI(unittest.TestCase):
         """Test MP3 and WAV sounds are loaded"""
         sound = simplequi.load_sound(get_example_resource_path('425556__planetronik__rock-808-beat.mp3'))
         sound2 = simplequi.load_sound(get_example_resource_path('253756_tape-on.wav'))
-        simplequi.create_timer(200, QApplication.instance().exit).start()
-        QApplication.instance().exec_()
+        pump_events(200, until=lambda: sound._Sound__sound_loaded and sound2._Sound__sound_loaded)
         self.assertTrue(sound._Sound__sound_loaded)
         self.assertTrue(sound2._Sound__sound_loaded)
 
@@ -24,14 +24,15 @@ import unittest
 from unittest.mock import call, Mock, patch
 
 from PySide2.QtCore import QPoint, Qt
-from PySide2.QtGui import QPolygon, QFont, QTransform, QPalette, QMouseEvent, QKeyEvent, QPixmap, QColor
+from PySide2.QtGui import QPolygon, QFont, QTransform, QPalette, QMouseEvent, QKeyEvent, QPixmap, QColor, QPainter
 from PySide2.QtWidgets import QWidget, QApplication
 
 import simplequi
-from simplequi._canvas import Canvas, DrawingAreaContainer
-from simplequi._colours import get_colour
+from simplequi._canvas import (_BRUSH_CACHE, _PEN_CACHE, _STYLE_CACHE_SIZE, Canvas, DrawingAreaContainer, get_brush,
+                               get_pen, radians_to_qpainter_angle, render_line, render_polygon)
+from simplequi._colours import COLOUR_MAP, get_colour
 from simplequi._fonts import FontManager
-from tests.helpers import pixmap_to_bytes, disable_call_counts
+from tests.helpers import pixmap_pixels, disable_call_counts
 
 
 class TestCanvas(unittest.TestCase):
@@ -81,18 +82,20 @@ class TestCanvas(unittest.TestCase):
 
     def test_drawing_calls(self):
         """Test all the drawing calls"""
-        with patch('simplequi._canvas.QPainter') as painter:
-            with patch('simplequi._canvas.QBrush') as brush:
-                with patch('simplequi._canvas.QPen') as pen:
-                    with patch('simplequi._canvas.get_pixmap') as get_pixmap:
-                        self.drawing_area.canvas.set_draw_handler(self.draw_handler)
-                        self.drawing_area.canvas.start()
-                        self.drawing_area.canvas._DrawingArea__draw()
+        # Empty the pen and brush caches so every pen and brush is created, and mocks don't stay cached afterwards
+        with patch.dict(_PEN_CACHE, clear=True), patch.dict(_BRUSH_CACHE, clear=True):
+            with patch('simplequi._canvas.QPainter') as painter:
+                with patch('simplequi._canvas.QBrush') as brush:
+                    with patch('simplequi._canvas.QPen') as pen:
+                        with patch('simplequi._canvas.get_pixmap') as get_pixmap:
+                            self.drawing_area.canvas.set_draw_handler(self.draw_handler)
+                            self.drawing_area.canvas.start()
+                            self.drawing_area.canvas._DrawingArea__draw()
 
         actual_brush = brush.return_value
         actual_painter = painter.return_value
 
-        painter.assert_called_once_with(self.drawing_area.canvas._DrawingArea__pixmap)
+        painter.assert_called_once_with(self.drawing_area.canvas._DrawingArea__image)
         pen_calls = [
             call(actual_brush, 1),
             call(actual_brush, 2),
@@ -123,6 +126,8 @@ class TestCanvas(unittest.TestCase):
 
         actual_painter.drawPoint.assert_called_once_with(10, 10)
         actual_painter.drawPolygon.assert_called_once_with(self.polygon)
+        # Only the polygon is axis-aligned with an even line width - the diagonal line keeps antialiasing
+        self.assertEqual(actual_painter.setRenderHint.call_args_list.count(call(painter.Antialiasing, False)), 1)
         actual_painter.drawPolyline.assert_called_once_with(self.polyline)
         actual_painter.drawPie.assert_called_once_with(85, 74, 40, 40, 180 * 16, -90 * 16)
         actual_painter.drawArc.assert_called_once_with(85, 74, 40, 40, 180 * 16, -90 * 16)
@@ -140,6 +145,130 @@ class TestCanvas(unittest.TestCase):
         actual_painter.setTransform.assert_called_once_with(transform)
         actual_painter.drawPixmap.assert_called_once_with(-75, -75, get_pixmap.return_value)
 
+    def test_antialiasing(self):
+        """Test antialiasing is only skipped where it makes no difference to the output"""
+        cases = [
+            (render_line, ((0, 10), (150, 10), 2, 'red'), True),
+            (render_line, ((10, 0), (10, 150), 4, 'red'), True),
+            (render_line, ((0, 10), (150, 10), 1, 'red'), False),
+            (render_line, ((0, 10), (150, 10), 3, 'red'), False),
+            (render_line, ((0, 10), (150, 10), 0, 'red'), False),
+            (render_line, ((0, 0), (150, 150), 2, 'red'), False),
+            (render_polygon, ([(0, 10), (10, 10), (10, 0), (0, 0)], 2, 'red', 'blue'), True),
+            (render_polygon, ([(0, 10), (10, 10), (10, 0), (0, 0)], 1, 'red', 'blue'), False),
+            (render_polygon, ([(0, 10), (10, 10), (10, 0), (0, 0)], 0, 'red', 'blue'), False),
+            (render_polygon, ([(0, 10), (10, 10), (5, 0)], 2, 'red', 'blue'), False),
+        ]
+        for render, args, disabled in cases:
+            with self.subTest(render=render.__name__, args=args):
+                painter = Mock()
+                render(painter, *args)
+                if disabled:
+                    painter.setRenderHint.assert_called_once_with(QPainter.Antialiasing, False)
+                else:
+                    painter.setRenderHint.assert_not_called()
+
+    def test_off_canvas_culling(self):
+        """Test primitives entirely outside the canvas are not queued for drawing"""
+        def draw_handler(canvas):
+            canvas.draw_point((-5, 10), 'red')
+            canvas.draw_line((160, 0), (200, 150), 2, 'red')
+            canvas.draw_polyline([(0, -50), (10, -50), (10, -40)], 2, 'red')
+            canvas.draw_polygon([(0, 160), (10, 160), (10, 170)], 2, 'red')
+            canvas.draw_circle((75, 200), 20, 5, 'red')
+            canvas.draw_arc((-30, 75), 20, 0, math.pi, 5, 'red')
+            canvas.draw_circle((75, 170), 20, 5, 'red')  # Only partly off the canvas, so still drawn
+
+        area = self.drawing_area.canvas
+        area.set_draw_handler(draw_handler)
+        area.start()
+        area._DrawingArea__draw()
+        objects = area._DrawingArea__objects
+        self.assertEqual(len(objects), 1)
+        self.assertEqual(objects[0].args[:2], ((75, 170), 20))
+
+    def test_reentrant_draw(self):
+        """Test a draw handler that triggers another draw, e.g. by processing events, doesn't recurse"""
+        area = self.drawing_area.canvas
+        handler = Mock(side_effect=lambda canvas: area._DrawingArea__draw())
+        area.set_draw_handler(handler)
+        area.start()
+        area._DrawingArea__draw()
+        handler.assert_called_once_with(area._DrawingArea__canvas)
+
+        # The guard is released afterwards, so the next frame is drawn as normal
+        area._DrawingArea__draw()
+        self.assertEqual(handler.call_count, 2)
+
+    def test_image_reuse(self):
+        """Test the rendering image and its pixels are reused between frames, and only replaced for a new background"""
+        frames = [True, False]
+
+        def draw_handler(canvas):
+            if frames.pop(0):
+                canvas.draw_polygon([(0, 0), (150, 0), (150, 150), (0, 150)], 1, 'red', 'red')
+
+        area = self.drawing_area.canvas
+        area.set_draw_handler(draw_handler)
+        area.start()
+        image = area._DrawingArea__image
+        pixel_data_id = image.cacheKey() >> 32  # Identifies the pixel buffer, which changes if it is ever copied
+        area._DrawingArea__draw()
+        area._DrawingArea__draw()
+        self.assertIs(area._DrawingArea__image, image)
+        self.assertEqual(image.cacheKey() >> 32, pixel_data_id)
+
+        # The second, empty frame should have cleared the first one back to the background
+        pixmap = QPixmap(150, 150)
+        pixmap.fill(QColor('black'))
+        self.assertEqual(pixmap_pixels(QPixmap.fromImage(area._DrawingArea__image)), pixmap_pixels(pixmap))
+
+        self.drawing_area.set_background_colour('aquamarine')
+        self.assertIsNot(area._DrawingArea__image, image)
+
+    def test_radians_to_qpainter_angle(self):
+        """Test angle conversion, including angles that fall just short of a whole 1/16th degree in floating point"""
+        self.assertEqual(radians_to_qpainter_angle(math.pi), 180 * 16)
+        self.assertEqual(radians_to_qpainter_angle(-math.pi / 2), -90 * 16)
+        self.assertEqual(radians_to_qpainter_angle(7 * math.pi / 6), 210 * 16)
+        self.assertEqual(radians_to_qpainter_angle(7 * math.pi / 3), 420 * 16)
+        self.assertEqual(radians_to_qpainter_angle(math.radians(-46)), -46 * 16)
+        for degrees in (249, 467, 485, 498, 503, -249):
+            self.assertEqual(radians_to_qpainter_angle(math.radians(degrees)), degrees * 16)
+
+    def test_pen_and_brush_cache(self):
+        """Test pens and brushes are only created once for each colour and width"""
+        with patch.dict(_PEN_CACHE, clear=True), patch.dict(_BRUSH_CACHE, clear=True), patch.dict(COLOUR_MAP):
+            pen = get_pen(3, 'red')
+            self.assertIs(get_pen(3, 'red'), pen)
+            self.assertIsNot(get_pen(4, 'red'), pen)
+            self.assertEqual(pen.width(), 3)
+            self.assertEqual(pen.color(), get_colour('red'))
+
+            brush = get_brush('red')
+            self.assertIs(get_brush('red'), brush)
+            self.assertEqual(brush.color(), get_colour('red'))
+            self.assertEqual(len(_PEN_CACHE), 2)
+            self.assertEqual(len(_BRUSH_CACHE), 1)
+
+            # Colour strings are case-insensitive, so should share the same cache entries
+            self.assertIs(get_pen(3, 'Red'), pen)
+            self.assertIs(get_brush('RED'), brush)
+            self.assertEqual(len(_PEN_CACHE), 2)
+            self.assertEqual(len(_BRUSH_CACHE), 1)
+
+            # Non-string colours fail with the same error as get_colour
+            with self.assertRaisesRegex(TypeError, 'invalid colour specifier'):
+                get_pen(1, None)
+            with self.assertRaisesRegex(TypeError, 'invalid colour specifier'):
+                get_brush(None)
+
+            # The caches are bounded, however many colours are used
+            for value in range(_STYLE_CACHE_SIZE + 10):
+                get_pen(1, 'rgb({}, {}, 0)'.format(value % 256, value // 256))
+            self.assertLessEqual(len(_PEN_CACHE), _STYLE_CACHE_SIZE)
+            self.assertLessEqual(len(_BRUSH_CACHE), _STYLE_CACHE_SIZE)
+
     def test_background_colour(self):
         """Test setting the canvas colour through the container"""
         self.drawing_area.set_background_colour('aquamarine')
@@ -148,8 +277,13 @@ class TestCanvas(unittest.TestCase):
         self.assertEqual(self.drawing_area.canvas._DrawingArea__background_colour, get_colour('aquamarine'))
         pixmap = QPixmap(150, 150)
         pixmap.fill(QColor('aquamarine'))
-        self.assertEqual(pixmap_to_bytes(self.drawing_area.canvas._DrawingArea__pixmap),
-                         pixmap_to_bytes(pixmap))
+        self.assertEqual(pixmap_pixels(QPixmap.fromImage(self.drawing_area.canvas._DrawingArea__image)),
+                         pixmap_pixels(pixmap))
+        self.assertTrue(self.drawing_area.canvas.testAttribute(Qt.WA_OpaquePaintEvent))
+
+        # Translucent backgrounds need the parent painted beneath them
+        self.drawing_area.set_background_colour('rgba(0, 0, 0, 0.5)')
+        self.assertFalse(self.drawing_area.canvas.testAttribute(Qt.WA_OpaquePaintEvent))
 
     def test_events(self):
         handled_calls = Mock()
@@ -165,6 +165,19 @@ class TestColours(unittest.TestCase):
         for inp in bad_data:
             self.assertRaises(KeyError, lambda: get_colour(inp))
 
+    def test_case_insensitive_map(self):
+        """Test every colour map lookup ignores case, and only caches lower-case keys"""
+        self.assertIn('Red', COLOUR_MAP)
+        self.assertIs(COLOUR_MAP.get('Red'), COLOUR_MAP['red'])
+        self.assertIs(COLOUR_MAP['RED'], COLOUR_MAP['red'])
+        self.assertNotIn(None, COLOUR_MAP)
+        self.assertIsNone(COLOUR_MAP.get(None))
+
+        colour = COLOUR_MAP['RGB(1, 2, 3)']
+        self.assertEqual(colour.getRgb(), (1, 2, 3, 255))
+        self.assertIs(get_colour('rgb(1, 2, 3)'), colour)
+        self.assertEqual([key for key in COLOUR_MAP if key != key.lower()], [])
+
     def test_invalid_names(self):
         """Test invalid colour strings not covered by other cases"""
         bad_data = [
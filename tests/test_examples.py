@@ -70,13 +70,17 @@ class TestExamples(unittest.TestCase):
         file_name = os.path.splitext(os.path.basename(script_path))[0]
         test_name = 'test_{}'.format(file_name)
 
-        def run_test(self):
-            with open(script_path) as inp:
-                script = inp.read()
-                script += SCRIPT_END
+        # Compile once here, so that re-running the test doesn't re-parse the script
+        with open(script_path) as inp:
+            code = compile(inp.read() + SCRIPT_END, script_path, 'exec')
 
+        def run_test(self):
+            cwd = os.getcwd()
             os.chdir(os.path.dirname(script_path))
-            exec(script, {})
+            try:
+                exec(code, {})
+            finally:
+                os.chdir(cwd)
 
         setattr(cls, test_name, run_test)
 
@@ -20,9 +20,10 @@
 # -----------------------------------------------------------------------------
 
 import unittest
+from functools import lru_cache
 from unittest.mock import patch, Mock, call
 
-from PySide2.QtCore import Qt, QPoint
+from PySide2.QtCore import QEvent, Qt, QPoint
 from PySide2.QtGui import QFont, QFontMetrics, QKeyEvent, QMouseEvent
 from PySide2.QtWidgets import QApplication, QLabel
 
@@ -30,18 +31,53 @@ import simplequi
 from simplequi._fonts import FontManager
 
 
+@lru_cache(maxsize=64)
+def font_width(size, family, text):
+    """Measures text in a font built directly with Qt, remembering the result so each font is only built once"""
+    font = QFont()
+    font.setPixelSize(size)
+    font.setFamily(family)
+    metrics = QFontMetrics(font)
+    return metrics.boundingRect(text).width()
+
+
+def close_frame(frame):
+    """Closes a frame and deletes its widgets straight away, rather than keeping them alive until the whole run ends"""
+    main_widget = frame._Frame__main_widget
+    main_widget.close()
+    main_widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
 class TestFrame(unittest.TestCase):
-    """Test Frame API"""
+    """Test Frame API, sharing one frame between tests as each test only checks the handlers and controls it sets up
+
+    Tests of a frame's starting state belong in :class:`TestFreshFrame` instead, as earlier tests here start the frame.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Creates the input events and the handler calls they should cause once, for all tests to share"""
+        cls.KEY_PRESS_L = QKeyEvent(QKeyEvent.KeyPress, Qt.Key_L, Qt.NoModifier)
+        cls.KEY_RELEASE_L = QKeyEvent(QKeyEvent.KeyRelease, Qt.Key_L, Qt.NoModifier)
+        cls.MOUSE_RELEASE_75_75 = QMouseEvent(QMouseEvent.MouseButtonRelease, QPoint(75, 75),
+                                              Qt.MiddleButton, Qt.NoButton, Qt.NoModifier)
+        cls.MOUSE_MOVE_100_75 = QMouseEvent(QMouseEvent.MouseMove, QPoint(100, 75),
+                                            Qt.MiddleButton, Qt.NoButton, Qt.NoModifier)
+        cls.HANDLER_CALLS = [
+            call((75, 75)),
+            call((100, 75)),
+            call(int(Qt.Key_L)),
+            call(int(Qt.Key_L))
+        ]
 
-    def setUp(self):
-        self.frame = simplequi.create_frame('FRAME', 100, 100)
-        self.main_widget = self.frame._Frame__main_widget
-        self.main_widget.hide()
+        cls.frame = simplequi.create_frame('FRAME', 100, 100)
+        cls.main_widget = cls.frame._Frame__main_widget
+        cls.main_widget.hide()
 
-    def test_frame_tracking(self):
-        self.assertIn(self.frame, QApplication.instance().tracked)
-        self.main_widget.close()
-        self.assertNotIn(self.frame, QApplication.instance().tracked)
+    @classmethod
+    def tearDownClass(cls):
+        close_frame(cls.frame)
 
     def test_background(self):
         with patch('simplequi._canvas.DrawingAreaContainer.set_background_colour') as setter:
@@ -49,23 +85,11 @@ class TestFrame(unittest.TestCase):
             self.frame.set_canvas_background('green')
             setter.assert_has_calls([call('indigo'), call('green')])
 
-    def test_start(self):
-        self.frame.start()
-        self.assertTrue(self.main_widget.canvas.started)
-
-    @staticmethod
-    def __font_width(size, family, text):
-        font = QFont()
-        font.setPixelSize(size)
-        font.setFamily(family)
-        metrics = QFontMetrics(font)
-        return metrics.boundingRect(text).width()
-
     def test_text_width(self):
         self.assertEqual(self.frame.get_canvas_textwidth('TEXT', 12, 'sans-serif'),
-                         self.__font_width(12, 'Helvetica', 'TEXT'))
+                         font_width(12, 'Helvetica', 'TEXT'))
         self.assertEqual(self.frame.get_canvas_textwidth(' _sfklujj', 37, 'monospace'),
-                         self.__font_width(37, FontManager.monospace, ' _sfklujj'))
+                         font_width(37, FontManager.monospace, ' _sfklujj'))
 
     @property
     def __last_control(self):
@@ -133,26 +157,13 @@ class TestFrame(unittest.TestCase):
         self.frame.set_mousedrag_handler(handler)
         self.frame.start()
 
-        key_press = QKeyEvent(QKeyEvent.KeyPress, Qt.Key_L, Qt.NoModifier)
-        key_release = QKeyEvent(QKeyEvent.KeyRelease, Qt.Key_L, Qt.NoModifier)
-        mouse_release = QMouseEvent(QMouseEvent.MouseButtonRelease, QPoint(75, 75),
-                                    Qt.MiddleButton, Qt.NoButton, Qt.NoModifier)
-        mouse_move = QMouseEvent(QMouseEvent.MouseMove, QPoint(100, 75),
-                                    Qt.MiddleButton, Qt.NoButton, Qt.NoModifier)
-        calls = [
-            call((75, 75)),
-            call((100, 75)),
-            call(int(Qt.Key_L)),
-            call(int(Qt.Key_L))
-        ]
+        self.main_widget.canvas.mouseReleaseEvent(self.MOUSE_RELEASE_75_75)
+        self.main_widget.canvas.mouseMoveEvent(self.MOUSE_MOVE_100_75)
+        self.main_widget.canvas.keyPressEvent(self.KEY_PRESS_L)
+        self.main_widget.canvas.keyReleaseEvent(self.KEY_RELEASE_L)
 
-        self.main_widget.canvas.mouseReleaseEvent(mouse_release)
-        self.main_widget.canvas.mouseMoveEvent(mouse_move)
-        self.main_widget.canvas.keyPressEvent(key_press)
-        self.main_widget.canvas.keyReleaseEvent(key_release)
-
-        handler.assert_has_calls(calls)
-        control_handler.assert_has_calls(calls)
+        handler.assert_has_calls(self.HANDLER_CALLS)
+        control_handler.assert_has_calls(self.HANDLER_CALLS)
 
     def test_set_draw_handler(self):
         handler = Mock()
@@ -161,12 +172,27 @@ class TestFrame(unittest.TestCase):
         self.main_widget.canvas._DrawingArea__draw()
         handler.assert_called_once_with(self.main_widget.canvas._DrawingArea__canvas)
 
-    def tearDown(self):
+
+class TestFreshFrame(unittest.TestCase):
+    """Test starting and tracking frames, which need a new frame that hasn't been started and can be closed"""
+
+    def test_start(self):
+        frame = simplequi.create_frame('FRAME', 100, 100)
+        canvas = frame._Frame__main_widget.canvas
+        frame._Frame__main_widget.hide()
         try:
-            self.main_widget.close()
-            self.main_widget = None
-        except AttributeError:
-            pass
+            self.assertFalse(canvas.started)
+            frame.start()
+            self.assertTrue(canvas.started)
+        finally:
+            close_frame(frame)
+
+    def test_frame_tracking(self):
+        frame = simplequi.create_frame('FRAME', 100, 100)
+        frame._Frame__main_widget.hide()
+        self.assertIn(frame, QApplication.instance().tracked)
+        close_frame(frame)
+        self.assertNotIn(frame, QApplication.instance().tracked)
 
 
 if __name__ == '__main__':
@@ -21,23 +21,82 @@
 
 import unittest
 from functools import partial
-from unittest.mock import patch, ANY
+from unittest.mock import patch, ANY, Mock
 
+from PySide2.QtCore import QByteArray
 from PySide2.QtNetwork import QNetworkReply
-from PySide2.QtWidgets import QApplication
 
 import simplequi
 from simplequi._image import _IMAGE_CACHE, _PIXMAP_CACHE, get_pixmap
-from tests.helpers import get_example_resource_path, pixmap_data, pixmap_to_bytes
+from simplequi._url import request
+from tests.helpers import (get_example_resource_path, image_loading_unavailable, pixmap_data, pixmap_pixels,
+                           pump_events)
 
 
+@unittest.skipIf(image_loading_unavailable(), 'image loading not available')
 class TestImage(unittest.TestCase):
     """Test Image API"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Loads and decodes the large sample image once, for all the tests that use it"""
+        cls.valid_img = simplequi.load_image(get_example_resource_path('sample_image.png'))
+        cls.valid_img_errors = []
+
+        def on_finished(callback, res):
+            res.deleteLater()
+            cls.valid_img_errors.append(res.error())
+            callback(res.readAll())
+
+        cls.valid_img_finish = cls.run_until_finished(on_finished)
+
     def setUp(self):
         self.error = None
         self.passed = None
 
+    @staticmethod
+    def run_until_finished(on_finished):
+        """Processes events until an image has finished loading, or for 500ms if it never does
+
+        :param on_finished: called instead of ``simplequi._url._on_finished`` with the load callback and network reply
+        :return: the mock that replaced ``_on_finished``, to check its calls
+        """
+        with patch('simplequi._url._on_finished') as finish:
+            finish.side_effect = on_finished
+            pump_events(500, until=lambda: finish.called)
+        return finish
+
+    @staticmethod
+    def load_with_fake_reply(url, error, data=b''):
+        """Loads an image through a fake network reply, so no real network or file access takes place
+
+        :param url: the URL to load the image from
+        :param error: the network error the reply finishes with
+        :param data: the data the reply returns
+        :return: the image and the fake reply, which can be finished with :meth:`finish_fake_reply`
+        """
+        reply = Mock(spec=QNetworkReply)
+        reply.error.return_value = error
+        reply.readAll.return_value = QByteArray(data)
+        with patch('simplequi._url.ManagerWrapper.manager') as manager:
+            manager.return_value.get.return_value = reply
+            img = simplequi.load_image(url)
+        return img, reply
+
+    @staticmethod
+    def finish_fake_reply(reply, on_finished):
+        """Finishes a fake reply straight away, rather than running the app to wait for it
+
+        :param reply: the fake reply from :meth:`load_with_fake_reply`
+        :param on_finished: called instead of ``simplequi._url._on_finished`` with the load callback and reply
+        :return: the mock that replaced ``_on_finished``, to check its calls
+        """
+        with patch('simplequi._url._on_finished') as finish:
+            finish.side_effect = on_finished
+            slot = reply.finished.connect.call_args[0][0]
+            slot()
+        return finish
+
     def on_finished(self, callback, res, fail=True):
         res.deleteLater()
         self.error = res.error()
@@ -50,11 +109,9 @@ class TestImage(unittest.TestCase):
         else:
             self.passed = True
 
-    def catch_finish(self, img, fail=True, width=0, height=0):
-        with patch('simplequi._url._on_finished') as finish:
-            finish.side_effect = partial(self.on_finished, fail=fail)
-            simplequi.create_timer(500, QApplication.instance().exit).start()
-            QApplication.instance().exec_()
+    def catch_finish(self, img, fail=True, width=0, height=0, reply=None):
+        on_finished = partial(self.on_finished, fail=fail)
+        finish = self.run_until_finished(on_finished) if reply is None else self.finish_fake_reply(reply, on_finished)
         finish.assert_called_with(img._Image__load_image, ANY)
         self.assertTrue(self.passed, 'failed when expected to succeed or vice versa')
         self.assertEqual(img.get_width(), width)
@@ -63,35 +120,51 @@ class TestImage(unittest.TestCase):
             self.assertEqual(self.error, QNetworkReply.NoError)
 
     def test_invalid_path(self):
-        """Non-existent path fails with a network error"""
-        img = simplequi.load_image('not_a_file.png')
-        self.catch_finish(img)
-        self.assertEqual(self.error, QNetworkReply.ProtocolUnknownError)
+        """Non-existent path gives a URL without a scheme, and a network error on loading leaves the image empty"""
+        # Only real files become file URLs, so no network access manager can handle a missing relative path
+        self.assertEqual(request('not_a_file.png').url().scheme(), '')
+
+        img, reply = self.load_with_fake_reply('not_a_file.png', QNetworkReply.ProtocolUnknownError)
+        self.catch_finish(img, reply=reply)
 
     def test_invalid_file(self):
         """Valid path but not an image fails to create the image or pixmaps"""
-        img = simplequi.load_image(__file__)
-        self.catch_finish(img, fail=False)
+        with open(__file__, 'rb') as this_file:
+            img, reply = self.load_with_fake_reply(__file__, QNetworkReply.NoError, this_file.read())
+        self.catch_finish(img, fail=False, reply=reply)
         self.assertIsNone(_IMAGE_CACHE[img])
         self.assertIsNone(get_pixmap(img, (10, 10), (10, 10), (10, 10)))
         self.assertNotIn(_IMAGE_CACHE[img], _PIXMAP_CACHE)
 
-    def test_valid_image_and_pixmaps(self):
-        img = simplequi.load_image(get_example_resource_path('sample_image.png'))
-        self.catch_finish(img, fail=False, width=1000, height=1200)
+    def test_valid_image(self):
+        """Valid image loads at its full size"""
+        img = self.valid_img
+        self.valid_img_finish.assert_called_with(img._Image__load_image, ANY)
+        self.assertEqual(self.valid_img_errors, [QNetworkReply.NoError])
+        self.assertEqual(img.get_width(), 1000)
+        self.assertEqual(img.get_height(), 1200)
         self.assertIsNotNone(_IMAGE_CACHE[img])
+
+    def test_pixmaps(self):
+        """Pixmaps are the right portions of the valid image, scaled to the right size"""
+        img = self.valid_img
         self.assertIsNotNone(get_pixmap(img, (10, 10), (10, 10), (10, 10)))
 
         small_unscaled = pixmap_data(img, 0, 0, 20, 20)
         small_scaled = pixmap_data(img, 0, 0, 20, 20, size=(30, 25))
         full_scaled = pixmap_data(img, 0, 0, 1000, 1200, size=(50, 60))
         middle = pixmap_data(img, 307, 293, 250, 302)
-
         self.assertNotEqual(small_unscaled, small_scaled)
-        self.assertEqual(pixmap_to_bytes(get_pixmap(img, (10, 10), (20, 20), (20, 20))), small_unscaled)
-        self.assertEqual(pixmap_to_bytes(get_pixmap(img, (10, 10), (20, 20), (30, 25))), small_scaled)
-        self.assertEqual(pixmap_to_bytes(get_pixmap(img, (500, 600), (1000, 1200), (50, 60))), full_scaled)
-        self.assertEqual(pixmap_to_bytes(get_pixmap(img, (432, 444), (250, 302), (250, 302))), middle)
+
+        cases = [
+            ((10, 10), (20, 20), (20, 20), small_unscaled),
+            ((10, 10), (20, 20), (30, 25), small_scaled),
+            ((500, 600), (1000, 1200), (50, 60), full_scaled),
+            ((432, 444), (250, 302), (250, 302), middle),
+        ]  # Source centre and size, target size and expected pixmap data
+        for centre, source_size, target_size, expected in cases:
+            with self.subTest(centre=centre, source_size=source_size, target_size=target_size):
+                self.assertEqual(pixmap_pixels(get_pixmap(img, centre, source_size, target_size)), expected)
 
 
 if __name__ == '__main__':
@@ -25,7 +25,7 @@ from PySide2.QtCore import QTimer
 from PySide2.QtWidgets import QApplication
 
 import simplequi
-from tests.helpers import get_example_resource_path, sound_unavailable
+from tests.helpers import get_example_resource_path, pump_events, sound_unavailable
 
 if not sound_unavailable():
     from PySide2.QtMultimedia import QMediaPlayer
@@ -53,13 +53,44 @@ class TestSound(unittest.TestCase):
 
         # Record tracked set before pausing sound
         tracked = set([])
-        QTimer.singleShot(200, lambda: tracked.update(QApplication.instance().tracked))
-        QTimer.singleShot(300, sound.rewind)
-        QApplication.instance().exec_()
+        finished = []
+
+        def record_and_rewind():
+            tracked.update(QApplication.instance().tracked)
+            sound.rewind()
+
+        def on_state_changed(state):
+            if state == QMediaPlayer.PlayingState:
+                # Wait for play() to return first, as the sound is only tracked once the player has started
+                QTimer.singleShot(0, record_and_rewind)
+            elif state == QMediaPlayer.StoppedState:
+                # Stop waiting as soon as the rewind stops the sound, rather than waiting for the app to notice
+                finished.append(state)
+
+        def on_status_changed(*_):
+            # Sounds that fail to load, or that aren't played, are finished with as soon as loading is done
+            player = sound._Sound__player
+            status = player.mediaStatus()
+            if (player.error() != QMediaPlayer.NoError or status == QMediaPlayer.InvalidMedia or
+                    (not (play or playing) and status >= QMediaPlayer.LoadedMedia)):
+                # The sound's own handler was connected first, so has already stopped tracking the sound by now
+                tracked.update(QApplication.instance().tracked)
+                finished.append(status)
+
+        sound._Sound__player.stateChanged.connect(on_state_changed)
+        sound._Sound__player.mediaStatusChanged.connect(on_status_changed)
+        sound._Sound__player.error.connect(on_status_changed)
+        done = pump_events(2000, until=lambda: finished)
+        sound._Sound__player.stateChanged.disconnect(on_state_changed)
+        sound._Sound__player.mediaStatusChanged.disconnect(on_status_changed)
+        sound._Sound__player.error.disconnect(on_status_changed)
+        self.assertTrue(done, 'timed out waiting for the sound')
 
         self.assertEqual(sound._Sound__sound_loaded, not fail)
         if fail or not (play or playing):
+            # Failed or unplayed sounds stop being tracked as soon as loading is done
             self.assertNotIn(sound, tracked)
+            self.assertNotIn(sound, QApplication.instance().tracked)
         elif play:
             # Sound was tracked before pausing
             self.assertIn(sound, tracked)
@@ -25,14 +25,13 @@ from unittest.mock import Mock, call
 from PySide2.QtWidgets import QApplication
 
 import simplequi
-from tests.helpers import disable_call_counts
 
 
 class TestTimer(unittest.TestCase):
     """Tested Timer API"""
 
     def setUp(self):
-        self.handler = Mock()
+        self.handler = Mock(spec=lambda: None, return_value=None)  # Timer handlers take no arguments
         self.app = QApplication.instance()
 
     def test_timer(self):
@@ -47,17 +46,14 @@ class TestTimer(unittest.TestCase):
         self.assertNotIn(timer, self.app.tracked)
 
     def test_handler(self):
+        """Test the handler is called on each timeout, firing the timer directly rather than waiting in real time"""
         timer = simplequi.create_timer(8, self.handler)
-        stop_timer = simplequi.create_timer(40, timer.stop)
-        exit_timer = simplequi.create_timer(50, self.app.exit)
         timer.start()
-        stop_timer.start()
-        exit_timer.start()
-        self.app.exec_()
+        for _ in range(5):
+            timer._Timer__timer.timeout.emit()
+        timer.stop()
         self.assertFalse(timer.is_running())
-        if not disable_call_counts():
-            self.assertAlmostEqual(self.handler.call_count, 5, delta=1)  # Allow delta due to timer inaccuracies
-        self.handler.assert_has_calls([call() for _ in range(self.handler.call_count)])
+        self.assertEqual(self.handler.call_args_list, [call()] * 5)
 
 
 if __name__ == '__main__':
@@ -32,18 +32,25 @@ from simplequi._widgets import Control, EventWidget, PlainTextSingleLine, TextIn
 class TestWidgets(unittest.TestCase):
     """Test widgets not covered by other tests"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Creates the key events once, for all tests to share"""
+        cls.ENTER_PRESS = QKeyEvent(QKeyEvent.KeyPress, Qt.Key_Enter, Qt.NoModifier)
+        cls.ENTER_RELEASE = QKeyEvent(QKeyEvent.KeyRelease, Qt.Key_Enter, Qt.NoModifier)
+
+    def setUp(self):
+        # Widgets accept the shared events, so reset them to check each test's widgets accept them again
+        self.ENTER_PRESS.ignore()
+        self.ENTER_RELEASE.ignore()
+
     def test_control(self):
         """Test text get and set"""
-        widget = QLabel('label_text')
-        control = Control(widget)
-        self.assertEqual(control.get_text(), 'label_text')
-        control.set_text('new')
-        self.assertEqual(control.get_text(), 'new')
-        widget = QPushButton('button')
-        control = Control(widget)
-        self.assertEqual(control.get_text(), 'button')
-        control.set_text('new')
-        self.assertEqual(control.get_text(), 'new')
+        for widget_type, text in [(QLabel, 'label_text'), (QPushButton, 'button')]:
+            with self.subTest(widget_type=widget_type.__name__):
+                control = Control(widget_type(text))
+                self.assertEqual(control.get_text(), text)
+                control.set_text('new')
+                self.assertEqual(control.get_text(), 'new')
 
     def test_event_widget(self):
         """Test default size and setting text"""
@@ -59,18 +66,16 @@ class TestWidgets(unittest.TestCase):
         widget = PlainTextSingleLine(None)
         self.assertTrue(widget.tabChangesFocus())
 
-        handler = Mock()
+        handler = Mock(spec=lambda text: None, return_value=None)  # Input handlers take just the entered text
         widget.enter_pressed.connect(handler)
-        event = QKeyEvent(QKeyEvent.KeyPress, Qt.Key_Enter, Qt.NoModifier)
         widget.setPlainText('text')
-        widget.keyPressEvent(event)
+        widget.keyPressEvent(self.ENTER_PRESS)
         handler.assert_not_called()
-        self.assertTrue(event.isAccepted())
+        self.assertTrue(self.ENTER_PRESS.isAccepted())
 
-        event = QKeyEvent(QKeyEvent.KeyRelease, Qt.Key_Enter, Qt.NoModifier)
-        widget.keyReleaseEvent(event)
+        widget.keyReleaseEvent(self.ENTER_RELEASE)
         handler.assert_called_once_with('text')
-        self.assertTrue(event.isAccepted())
+        self.assertTrue(self.ENTER_RELEASE.isAccepted())
 
     def test_text_input_widget(self):
         """Test widget layout and text get and set"""